@@ -0,0 +1,80 @@
+import argparse
+
+# Each command imports only its own subsystem, so preprocess/score never pay for fastf1 or requests
+
+def run_collect(args):
+    from src import data_collection
+    if args.cache_dir:
+        data_collection.set_cache_dir(args.cache_dir)
+    data_collection.collect_data(args.seasons, args.raw_dir, resume=args.resume)
+
+def run_preprocess(args):
+    from src import preprocessing
+    for season in args.seasons:
+        preprocessing.preprocess_season_data(season)
+
+def run_score(args):
+    from src import analysis
+    for season in args.seasons:
+        analysis.analyze_season_overtakes(season)
+        analysis.analyze_season_pitstops(season)
+    analysis.build_pitstop_baselines(args.seasons)
+
+def run_live(args):
+    from src import data_collection, live
+    if args.cache_dir:
+        data_collection.set_cache_dir(args.cache_dir)
+    live.run_live(args.season)
+
+def run_synthetic(args):
+    from src import synthetic
+    synthetic.generate_seasons(args.seasons, args.events, args.output_dir, seed=args.seed)
+
+def run_benchmark(args):
+    from src import benchmark
+    benchmark.run_benchmarks(args.scales, args.repeat)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="F1 Fantasy prediction pipeline")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    collect = subparsers.add_parser('collect', help="Download raw season data from FastF1 and Ergast")
+    collect.add_argument('--seasons', type=int, nargs='+', default=[2025])
+    collect.add_argument('--raw-dir', default="data/raw")
+    collect.add_argument('--cache-dir', default=None, help="FastF1 cache directory (default: $FASTF1_CACHE_DIR or fastf1cache)")
+    collect.add_argument('--resume', action='store_true', help="Skip event sessions that already have checkpoints; season-level files are always refetched")
+    collect.set_defaults(func=run_collect)
+
+    preprocess = subparsers.add_parser('preprocess', help="Clean raw data into data/processed")
+    preprocess.add_argument('--seasons', type=int, nargs='+', default=[2025])
+    preprocess.set_defaults(func=run_preprocess)
+
+    score = subparsers.add_parser('score', help="Score positions gained, overtakes and pit stops")
+    score.add_argument('--seasons', type=int, nargs='+', default=[2025])
+    score.set_defaults(func=run_score)
+
+    live = subparsers.add_parser('live', help="Follow a race weekend and update results as sessions finish")
+    live.add_argument('--season', type=int, default=2025)
+    live.add_argument('--cache-dir', default=None, help="FastF1 cache directory (default: $FASTF1_CACHE_DIR or fastf1cache)")
+    live.set_defaults(func=run_live)
+
+    synthetic = subparsers.add_parser('synthetic', help="Generate synthetic raw season data")
+    synthetic.add_argument('--seasons', type=int, nargs='+', default=[2025])
+    synthetic.add_argument('--events', type=int, default=24)
+    synthetic.add_argument('--output-dir', default="data/synthetic", help="Where to write the raw-format CSVs (default keeps them out of data/raw)")
+    synthetic.add_argument('--seed', type=int, default=0)
+    synthetic.set_defaults(func=run_synthetic)
+
+    benchmark = subparsers.add_parser('benchmark', help="Time the pipeline on synthetic data")
+    benchmark.add_argument('--scales', nargs='+', default=None, choices=['small', 'medium', 'large'])
+    benchmark.add_argument('--repeat', type=int, default=5)
+    benchmark.set_defaults(func=run_benchmark)
+
+    return parser
+
+def main(argv = None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,447 @@
+import pandas as pd
+import numpy as np
+import unicodedata
+import json
+import os
+
+RAW_DIR = "data/raw"
+PROCESSED_DIR = "data/processed"
+SCORING_PATH = "data/fantasy/scoring.json"
+
+LAP_KEYS = ['season', 'event', 'driver']
+
+# Ergast only reports pit-lane time. Stationary time is estimated against each circuit's lane transit,
+# taken as the low quantile of its valid stops in the other analysed seasons, where the car is assumed
+# to have stood still for REFERENCE_STATIONARY; estimates never go below the stationary record.
+# Races whose transit rests on fewer than MIN_TRANSIT_SEASONS other seasons get no band points
+REFERENCE_STATIONARY = 2.0
+RECORD_STATIONARY = 1.8
+TRANSIT_QUANTILE = 0.05
+MIN_TRANSIT_SEASONS = 2
+
+# Modified z-score above which a stop is treated as a problem stop or penalty
+OUTLIER_Z = 3.5
+
+_pitstop_baselines = None
+
+def load_scoring(path = SCORING_PATH):
+    try:
+        with open(path) as f:
+            return json.load(f)
+
+    except Exception as e:
+        print(f"Error loading scoring {path}: {e}")
+        return None
+
+def load_processed(name, season):
+    path = os.path.join(PROCESSED_DIR, str(season), f"{name}.csv")
+
+    if not os.path.exists(path):
+        print(f"File not found: {path}")
+        return None
+
+    return pd.read_csv(path)
+
+def load_drivers(season):
+    # Drivers are not part of the processed tables; the raw file only feeds Ergast id mapping
+    path = os.path.join(RAW_DIR, str(season), "drivers.csv")
+
+    if not os.path.exists(path):
+        print(f"File not found: {path}")
+        return None
+
+    return pd.read_csv(path)
+
+def mark_pit_laps(laps, pitstops = None):
+    # In-lap and out-lap of every stop: the stint number changes across them
+    group = laps.groupby(LAP_KEYS, sort=False)['stint']
+    prev_stint = group.shift(1)
+    next_stint = group.shift(-1)
+    pit_lap = (prev_stint.notna() & (laps['stint'] != prev_stint)) | \
+              (next_stint.notna() & (laps['stint'] != next_stint))
+
+    # Ergast stops catch pit cycles the stint column misses (e.g. drive-throughs, no tyre change)
+    if pitstops is not None and not pitstops.empty:
+        stops = pitstops[['season', 'race', 'driver', 'lap_number']].dropna()
+        stops = stops.rename(columns={'race': 'event'})
+        stops = pd.concat([stops, stops.assign(lap_number=stops['lap_number'] + 1)])
+        stops['lap_number'] = stops['lap_number'].astype(laps['lap_number'].dtype)
+        stops = stops.drop_duplicates()
+        stops['stop_lap'] = True
+
+        stop_lap = laps[LAP_KEYS + ['lap_number']].merge(stops, on=LAP_KEYS + ['lap_number'], how='left')['stop_lap']
+        pit_lap = pit_lap | stop_lap.fillna(False).astype(bool).to_numpy()
+
+    return pit_lap
+
+def mark_retirement_laps(laps, race_results = None):
+    if race_results is None or race_results.empty or 'did_not_finish' not in race_results.columns:
+        return pd.Series(False, index=laps.index)
+
+    retired = race_results.loc[race_results['did_not_finish'].astype(bool), LAP_KEYS].drop_duplicates()
+    retired['retired'] = True
+
+    is_retired = laps[LAP_KEYS].merge(retired, on=LAP_KEYS, how='left')['retired'].fillna(False).astype(bool).to_numpy()
+    last_lap = laps['lap_number'] == laps.groupby(LAP_KEYS, sort=False)['lap_number'].transform('max')
+
+    return last_lap & is_retired
+
+def reconstruct_position_changes(laptimes, pitstops = None, race_results = None):
+    if laptimes is None or laptimes.empty:
+        print("No lap times data to reconstruct positions from")
+        return None
+
+    laps = laptimes[LAP_KEYS + ['lap_number', 'position', 'stint']].copy()
+    laps = laps.sort_values(LAP_KEYS + ['lap_number']).reset_index(drop=True)
+
+    group = laps.groupby(LAP_KEYS, sort=False)
+    laps['prev_position'] = group['position'].shift(1)
+    laps['prev_lap_number'] = group['lap_number'].shift(1)
+    laps['position_change'] = laps['prev_position'] - laps['position']
+
+    laps['pit_lap'] = mark_pit_laps(laps, pitstops)
+    laps['retired_lap'] = mark_retirement_laps(laps, race_results)
+
+    # A lap counts as on-track racing only if both ends of it are known and no pit or retirement is involved
+    laps['on_track'] = (
+        laps['position'].notna()
+        & laps['prev_position'].notna()
+        & (laps['lap_number'] - laps['prev_lap_number'] == 1)
+        & ~laps['pit_lap']
+        & ~laps['retired_lap']
+    )
+
+    # Re-rank positions among the on-track drivers of each lap, so places handed over by
+    # someone else pitting or retiring do not show up as gains for the cars behind
+    lap_group = ['season', 'event', 'lap_number']
+    on_track = laps.loc[laps['on_track'], lap_group + ['prev_position', 'position']]
+    ranks = on_track.groupby(lap_group, sort=False)
+    prev_rank = ranks['prev_position'].rank(method='first')
+    rank = ranks['position'].rank(method='first')
+
+    laps['on_track_change'] = 0.0
+    laps.loc[on_track.index, 'on_track_change'] = prev_rank - rank
+
+    return laps.drop(columns=['prev_lap_number'])
+
+def count_overtakes(changes):
+    if changes is None or changes.empty:
+        print("No position changes to count overtakes from")
+        return None
+
+    on_track_change = changes['on_track_change'].to_numpy()
+    counts = changes[LAP_KEYS].assign(
+        overtakes=np.clip(on_track_change, 0, None),
+        overtaken=np.clip(-on_track_change, 0, None),
+        laps_counted=changes['on_track'].astype(int),
+        pit_laps=changes['pit_lap'].astype(int),
+    )
+
+    counts = counts.groupby(LAP_KEYS, as_index=False).sum()
+    counts[['overtakes', 'overtaken']] = counts[['overtakes', 'overtaken']].astype(int)
+
+    return counts
+
+def positions_gained(race_results):
+    if race_results is None or race_results.empty:
+        print("No race results data to compute positions gained")
+        return None
+
+    df = race_results[LAP_KEYS + ['grid_pos', 'finish_pos_numeric']].copy()
+
+    # Pit lane starters are scored as starting from the back of the field
+    field_size = race_results.groupby(['season', 'event'])['driver'].transform('count')
+    if 'pit_lane_start' in race_results.columns:
+        df['grid_pos'] = df['grid_pos'].where(~race_results['pit_lane_start'].astype(bool), field_size)
+
+    df['positions_gained'] = df['grid_pos'] - df['finish_pos_numeric']
+
+    # Classified-only: retirements are penalised through the DNF score instead
+    if 'did_not_finish' in race_results.columns:
+        df.loc[race_results['did_not_finish'].astype(bool), 'positions_gained'] = 0
+
+    return df
+
+def score_position_changes(gained, overtakes, scoring, session = 'race'):
+    if gained is None or overtakes is None or scoring is None:
+        print("Missing inputs for position change scoring")
+        return None
+
+    rules = scoring['driver'][session]
+
+    df = gained.merge(overtakes, on=LAP_KEYS, how='left')
+    df['overtakes'] = df['overtakes'].fillna(0).astype(int)
+
+    df['gained_points'] = np.where(
+        df['positions_gained'] > 0,
+        df['positions_gained'] * rules['gained'],
+        -df['positions_gained'] * rules['lost'],
+    )
+    df['gained_points'] = df['gained_points'].fillna(0)
+    df['overtake_points'] = df['overtakes'] * rules['overtake']
+    df['position_change_points'] = df['gained_points'] + df['overtake_points']
+
+    return df
+
+def strip_accents(name):
+    return unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+
+def driver_id_map(drivers):
+    # Ergast ids are the accent-free surname, or first_last when a surname is shared
+    names = drivers[['first_name', 'last_name', 'driver']].dropna()
+    first = names['first_name'].map(strip_accents).str.upper().str.replace(' ', '_')
+    last = names['last_name'].map(strip_accents).str.upper().str.replace(' ', '_')
+
+    ids = dict(zip(first + '_' + last, names['driver']))
+    ids.update(zip(last, names['driver']))
+
+    return ids
+
+def map_pitstop_drivers(pitstops, race_results, drivers = None):
+    if pitstops is None or pitstops.empty or race_results is None or race_results.empty:
+        print("No pit stops or race results to map drivers")
+        return None
+
+    df = pitstops.copy()
+    df['driver'] = df['driver'].astype(str).str.upper()
+    if drivers is not None and not drivers.empty:
+        df['driver'] = df['driver'].replace(driver_id_map(drivers))
+
+    teams = race_results[LAP_KEYS + ['constructor']].drop_duplicates(LAP_KEYS).rename(columns={'event': 'race'})
+    df = df.merge(teams, on=['season', 'race', 'driver'], how='left')
+
+    unmapped = df['constructor'].isna()
+    if unmapped.any():
+        print(f"Warning: {unmapped.sum()} pit stops with unknown drivers: {sorted(df.loc[unmapped, 'driver'].unique())}")
+
+    return df[~unmapped].reset_index(drop=True)
+
+def grouped_median_mad(df, keys, col):
+    median = df.groupby(keys)[col].transform('median')
+    mad = (df[col] - median).abs().groupby([df[key] for key in keys]).transform('median')
+
+    return median, mad
+
+def pitstop_bands(scoring):
+    # Band keys look like '<2', '2.00 - 2.19', '2.5-2.99' and '>3'; each band is binned on its lower bound
+    bands = {}
+    for key, points in scoring['constructor']['pitstop']['time'].items():
+        key = key.replace(' ', '')
+        if key.startswith('<'):
+            bands[-np.inf] = points
+        elif key.startswith('>'):
+            bands[float(key[1:])] = points
+        else:
+            bands[float(key.split('-')[0])] = points
+
+    edges = sorted(bands)
+    return np.array(edges), np.array([bands[edge] for edge in edges])
+
+def score_stationary_times(times, scoring):
+    edges, points = pitstop_bands(scoring)
+    times = np.asarray(times, dtype=float)
+    band = np.searchsorted(edges, np.nan_to_num(times, nan=np.inf), side='right') - 1
+
+    return np.where(np.isnan(times), 0, points[band])
+
+def analyze_pitstops(stops, schedule = None):
+    # Invalid durations were median-filled during preprocessing, so drop them by flag rather than by NaN
+    if 'duration_valid' in stops.columns:
+        stops = stops[stops['duration_valid'].astype(bool)]
+    df = stops.dropna(subset=['duration']).copy()
+
+    if schedule is not None and not schedule.empty:
+        circuits = schedule[['season', 'event', 'location']].rename(columns={'event': 'race', 'location': 'circuit'})
+        df = df.merge(circuits, on=['season', 'race'], how='left')
+    else:
+        df['circuit'] = np.nan
+    df['circuit'] = df['circuit'].fillna(df['race'])
+
+    # Race-wide robust z-score: pit lane length dominates, so outliers are judged against the same race
+    race_median, race_mad = grouped_median_mad(df, ['season', 'race'], 'duration')
+    df['robust_z'] = 0.6745 * (df['duration'] - race_median) / race_mad.replace(0, np.nan)
+    df['outlier'] = df['robust_z'].abs() > OUTLIER_Z
+
+    return df
+
+def estimate_stationary_times(stops):
+    clean = stops[~stops['outlier'].astype(bool)]
+
+    # Each season is calibrated on the circuit's other seasons, so the stops being scored never set their own anchor
+    season_transit = clean.groupby(['circuit', 'season'])['duration'].quantile(TRANSIT_QUANTILE).rename('season_transit').reset_index()
+    pairs = season_transit[['circuit', 'season']].merge(season_transit.rename(columns={'season': 'other_season'}), on='circuit')
+    pairs = pairs[pairs['season'] != pairs['other_season']]
+    transit = pairs.groupby(['circuit', 'season'], as_index=False).agg(
+        lane_transit=('season_transit', 'median'),
+        transit_seasons=('other_season', 'size'),
+    )
+    transit['lane_transit'] -= REFERENCE_STATIONARY
+
+    df = stops.drop(columns=['lane_transit', 'transit_seasons', 'est_stationary'], errors='ignore')
+    df = df.merge(transit, on=['circuit', 'season'], how='left')
+    df['transit_seasons'] = df['transit_seasons'].fillna(0).astype(int)
+    df['est_stationary'] = (df['duration'] - df['lane_transit']).clip(lower=RECORD_STATIONARY)
+
+    return df
+
+def score_pitstops(stops, scoring):
+    clean = stops[~stops['outlier'].astype(bool)]
+
+    # Constructors are scored on their fastest stop of the race
+    race = clean.groupby(['season', 'race', 'circuit', 'constructor'], as_index=False).agg(
+        fastest_stationary=('est_stationary', 'min'),
+        median_duration=('duration', 'median'),
+        stops=('duration', 'size'),
+        transit_seasons=('transit_seasons', 'first'),
+    )
+
+    # Bands are only as good as the transit estimate, so thinly calibrated circuits are left unscored
+    race['band_scored'] = race['transit_seasons'] >= MIN_TRANSIT_SEASONS
+    race['band_points'] = np.where(race['band_scored'], score_stationary_times(race['fastest_stationary'], scoring), 0)
+    race['band_basis'] = np.where(
+        race['band_scored'],
+        f"estimated: pit-lane time minus other seasons' transit, assuming {REFERENCE_STATIONARY}s stationary",
+        f"not scored: transit needs {MIN_TRANSIT_SEASONS} other seasons at this circuit",
+    )
+
+    # One winner per race, taken from the measured duration since the clipped estimates tie at the record
+    fastest = clean.loc[clean.groupby(['season', 'race'])['duration'].idxmin(), ['season', 'race', 'constructor']]
+    fastest['fastest_of_race'] = True
+    race = race.merge(fastest, on=['season', 'race', 'constructor'], how='left')
+    race['fastest_of_race'] = race['fastest_of_race'].fillna(False).astype(bool)
+    race['pitstop_points'] = race['band_points'] + race['fastest_of_race'] * scoring['constructor']['pitstop']['fastest']
+
+    return race
+
+def analyze_season_pitstops(season):
+    print(f"\n{'='*70}")
+    print(f"PIT STOP ANALYSIS SEASON {season}")
+    print(f"{'='*70}")
+
+    pitstops = load_processed('pitstops', season)
+    race_results = load_processed('race_results', season)
+    schedule = load_processed('schedule', season)
+    scoring = load_scoring()
+
+    drivers = load_drivers(season)
+
+    stops = map_pitstop_drivers(pitstops, race_results, drivers)
+    if stops is None or stops.empty or scoring is None:
+        print(f"Skipping pit stop analysis {season} - missing data")
+        return None
+
+    stops = analyze_pitstops(stops, schedule)
+
+    output_path = os.path.join(PROCESSED_DIR, str(season), "pitstop_analysis.csv")
+    stops.to_csv(output_path, index=False)
+    print(f"{len(stops)} valid stops analysed, {stops['outlier'].sum()} outliers")
+    print(f"Saved to: {output_path}")
+
+    return stops
+
+def build_pitstop_baselines(seasons):
+    stops = [load_processed('pitstop_analysis', season) for season in seasons]
+    stops = [df for df in stops if df is not None]
+    scoring = load_scoring()
+
+    if not stops or scoring is None:
+        print("No pit stop analysis to build baselines from")
+        return None
+
+    stops = estimate_stationary_times(pd.concat(stops, ignore_index=True))
+    race = score_pitstops(stops, scoring)
+
+    for season, df in race.groupby('season'):
+        output_path = os.path.join(PROCESSED_DIR, str(season), "pitstop_points.csv")
+        df.to_csv(output_path, index=False)
+        print(f"Saved to: {output_path}")
+
+    print(
+        f"ASSUMPTION: band points use stationary times estimated as pit-lane time minus the circuit's "
+        f"{TRANSIT_QUANTILE:.0%} quantile in other seasons, plus {REFERENCE_STATIONARY}s, floored at {RECORD_STATIONARY}s"
+    )
+    print(f"{(~race['band_scored']).sum()} of {len(race)} constructor races not band scored (fewer than {MIN_TRANSIT_SEASONS} other seasons)")
+
+    stops = stops[~stops['outlier'].astype(bool)]
+
+    keys = ['circuit', 'constructor']
+    stops['lane_median'], stops['lane_mad'] = grouped_median_mad(stops, keys, 'duration')
+    baselines = stops.groupby(keys, as_index=False).agg(
+        lane_median=('lane_median', 'first'),
+        lane_mad=('lane_mad', 'first'),
+        lane_transit=('lane_transit', 'median'),
+        transit_seasons=('transit_seasons', 'max'),
+        stationary_median=('est_stationary', 'median'),
+        stops=('duration', 'size'),
+    )
+    baselines['reference_stationary'] = REFERENCE_STATIONARY
+
+    expected = race.groupby(keys, as_index=False).agg(
+        expected_points=('pitstop_points', 'mean'),
+        fastest_rate=('fastest_of_race', 'mean'),
+        band_scored_races=('band_scored', 'sum'),
+        races=('pitstop_points', 'size'),
+    )
+    baselines = baselines.merge(expected, on=keys, how='left')
+
+    output_path = os.path.join(PROCESSED_DIR, "pitstop_baselines.csv")
+    baselines.to_csv(output_path, index=False)
+    print(f"Saved to: {output_path}")
+
+    global _pitstop_baselines
+    _pitstop_baselines = None
+
+    return baselines
+
+def get_pitstop_baseline(circuit, constructor):
+    # Loaded once into a dict so simulator and optimizer lookups are constant time
+    global _pitstop_baselines
+    if _pitstop_baselines is None:
+        path = os.path.join(PROCESSED_DIR, "pitstop_baselines.csv")
+        if not os.path.exists(path):
+            print(f"File not found: {path}")
+            return None
+
+        baselines = pd.read_csv(path)
+        _pitstop_baselines = {
+            (row['circuit'], row['constructor']): row
+            for row in baselines.to_dict('records')
+        }
+
+    return _pitstop_baselines.get((circuit, constructor))
+
+def analyze_season_overtakes(season):
+    print(f"\n{'='*70}")
+    print(f"OVERTAKE ANALYSIS SEASON {season}")
+    print(f"{'='*70}")
+
+    laptimes = load_processed('laptimes', season)
+    pitstops = load_processed('pitstops', season)
+    race_results = load_processed('race_results', season)
+    scoring = load_scoring()
+
+    drivers = load_drivers(season)
+    pitstops = map_pitstop_drivers(pitstops, race_results, drivers)
+
+    changes = reconstruct_position_changes(laptimes, pitstops, race_results)
+    overtakes = count_overtakes(changes)
+    gained = positions_gained(race_results)
+    scored = score_position_changes(gained, overtakes, scoring, 'race')
+
+    if scored is None:
+        print(f"Skipping overtake analysis {season} - missing data")
+        return None
+
+    output_path = os.path.join(PROCESSED_DIR, str(season), "overtakes.csv")
+    scored.to_csv(output_path, index=False)
+    print(f"{len(scored)} driver results scored")
+    print(f"Saved to: {output_path}")
+
+    return scored
+
+if __name__ == "__main__":
+    seasons = [2025]
+    for season in seasons:
+        analyze_season_overtakes(season)
+        analyze_season_pitstops(season)
+    build_pitstop_baselines(seasons)
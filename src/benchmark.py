@@ -0,0 +1,230 @@
+import pandas as pd
+import numpy as np
+import contextlib
+import datetime
+import platform
+import subprocess
+import tempfile
+import socket
+import json
+import time
+import io
+import sys
+import os
+
+from src import preprocessing
+from src import analysis
+from src import synthetic
+
+# name: (seasons, events per season)
+SCALES = {
+    'small': (1, 4),
+    'medium': (1, 24),
+    'large': (3, 24),
+}
+
+REGRESSION_THRESHOLD = 1.25
+
+# Modules whose cold import time is tracked, each in a fresh interpreter
+STARTUP_MODULES = ['src.preprocessing', 'src.analysis', 'src.data_collection']
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Per-host results stay local (ignored by git); timings only compare on the machine that produced them
+BENCHMARK_DIR = os.path.join(REPO_DIR, "data", "benchmarks")
+
+def time_call(func, make_args, repeat = 5):
+    # Arguments are rebuilt outside the timer because the clean_* functions modify their input
+    timings = []
+    for _ in range(repeat):
+        args = make_args()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(*args)
+            timings.append(time.perf_counter() - start)
+
+    return timings
+
+def time_startup(module, repeat = 5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', f"import {module}"], cwd=REPO_DIR, check=True)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+def load_raw(raw_dir, seasons, filename):
+    return pd.concat(
+        [pd.read_csv(os.path.join(raw_dir, str(season), filename)) for season in seasons],
+        ignore_index=True,
+    )
+
+def preprocess_all(seasons):
+    for season in seasons:
+        preprocessing.preprocess_season_data(season)
+
+def score_overtakes(laptimes, pitstops, race_results):
+    changes = analysis.reconstruct_position_changes(laptimes, pitstops, race_results)
+    return analysis.count_overtakes(changes)
+
+def score_pitstops(pitstops, race_results, schedule, scoring):
+    stops = analysis.map_pitstop_drivers(pitstops, race_results)
+    stops = analysis.estimate_stationary_times(analysis.analyze_pitstops(stops, schedule))
+    return analysis.score_pitstops(stops, scoring)
+
+def write_csv(df, path):
+    df.to_csv(path, index=False)
+
+def benchmark_cases(raw_dir, processed_dir, seasons):
+    raw = {
+        filename: load_raw(raw_dir, seasons, filename)
+        for filename in [
+            'driver_standings.csv', 'constructor_standings.csv', 'schedule.csv', 'race.csv',
+            'quali_results.csv', 'laptimes.csv', 'pitstops.csv', 'weather.csv', 'race_events.csv',
+        ]
+    }
+    processed = {
+        name: load_raw(processed_dir, seasons, f"{name}.csv")
+        for name in ['laptimes', 'pitstops', 'race_results', 'schedule']
+    }
+    scoring = analysis.load_scoring(os.path.join(REPO_DIR, analysis.SCORING_PATH))
+    laptimes_path = os.path.join(raw_dir, str(seasons[0]), 'laptimes.csv')
+    output_path = os.path.join(processed_dir, 'benchmark_write.csv')
+
+    def copy_of(filename, **kwargs):
+        return lambda: (raw[filename].copy(),) + tuple(kwargs.values())
+
+    return [
+        ('clean_standings[driver]', preprocessing.clean_standings, copy_of('driver_standings.csv', type='driver'), len(raw['driver_standings.csv'])),
+        ('clean_standings[constructor]', preprocessing.clean_standings, copy_of('constructor_standings.csv', type='constructor'), len(raw['constructor_standings.csv'])),
+        ('clean_schedule_info', preprocessing.clean_schedule_info, copy_of('schedule.csv'), len(raw['schedule.csv'])),
+        ('clean_results[R]', preprocessing.clean_results, copy_of('race.csv', type='R'), len(raw['race.csv'])),
+        ('clean_results[Q]', preprocessing.clean_results, copy_of('quali_results.csv', type='Q'), len(raw['quali_results.csv'])),
+        ('clean_laptimes', preprocessing.clean_laptimes, copy_of('laptimes.csv'), len(raw['laptimes.csv'])),
+        ('clean_pitstops', preprocessing.clean_pitstops, copy_of('pitstops.csv'), len(raw['pitstops.csv'])),
+        ('clean_weather_data', preprocessing.clean_weather_data, copy_of('weather.csv'), len(raw['weather.csv'])),
+        ('clean_race_events', preprocessing.clean_race_events, copy_of('race_events.csv'), len(raw['race_events.csv'])),
+        ('standardize_driver_names', preprocessing.standardize_driver_names, copy_of('laptimes.csv'), len(raw['laptimes.csv'])),
+        ('standardize_constructor_names', preprocessing.standardize_constructor_names, copy_of('laptimes.csv'), len(raw['laptimes.csv'])),
+        ('preprocess_season_data', preprocess_all, lambda: (seasons,), sum(len(df) for df in raw.values())),
+        ('score_overtakes', score_overtakes, lambda: (processed['laptimes'], processed['pitstops'], processed['race_results']), len(processed['laptimes'])),
+        ('score_pitstops', score_pitstops, lambda: (processed['pitstops'], processed['race_results'], processed['schedule'], scoring), len(processed['pitstops'])),
+        ('io.read_laptimes', pd.read_csv, lambda: (laptimes_path,), len(raw['laptimes.csv'])),
+        ('io.write_laptimes', write_csv, lambda: (raw['laptimes.csv'], output_path), len(raw['laptimes.csv'])),
+    ]
+
+def run_scale(scale, repeat = 5, seed = 0):
+    n_seasons, n_events = SCALES[scale]
+    seasons = list(range(2025 - n_seasons + 1, 2026))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        raw_dir = os.path.join(tmp_dir, 'raw')
+        processed_dir = os.path.join(tmp_dir, 'processed')
+        synthetic.generate_seasons(seasons, n_events, raw_dir, seed=seed)
+
+        # Point the pipeline at the synthetic tree for the duration of the run
+        saved_dirs = (preprocessing.RAW_DIR, preprocessing.PROCESSED_DIR)
+        preprocessing.RAW_DIR, preprocessing.PROCESSED_DIR = raw_dir, processed_dir
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                preprocess_all(seasons)
+
+            records = []
+            for name, func, make_args, rows in benchmark_cases(raw_dir, processed_dir, seasons):
+                timings = time_call(func, make_args, repeat)
+                records.append({
+                    'benchmark': name,
+                    'scale': scale,
+                    'rows': int(rows),
+                    'min_s': min(timings),
+                    'median_s': float(np.median(timings)),
+                })
+                print(f"  {name:<32} {scale:<8} {rows:>9} rows  min {min(timings) * 1000:9.2f} ms")
+        finally:
+            preprocessing.RAW_DIR, preprocessing.PROCESSED_DIR = saved_dirs
+
+    return records
+
+def results_path(benchmark_dir = BENCHMARK_DIR):
+    return os.path.join(benchmark_dir, f"{socket.gethostname()}.jsonl")
+
+def load_previous(path):
+    if not os.path.exists(path):
+        return {}
+
+    previous = {}
+    with open(path) as f:
+        for line in f:
+            record = json.loads(line)
+            previous[(record['benchmark'], record['scale'])] = record
+
+    return previous
+
+def report_regressions(records, previous, threshold = REGRESSION_THRESHOLD):
+    regressions = []
+    for record in records:
+        last = previous.get((record['benchmark'], record['scale']))
+        if last is None or last['min_s'] <= 0:
+            continue
+
+        ratio = record['min_s'] / last['min_s']
+        if ratio > threshold:
+            regressions.append((record['benchmark'], record['scale'], ratio))
+
+    if regressions:
+        print(f"\nREGRESSIONS (> {threshold:.2f}x previous run):")
+        for name, scale, ratio in regressions:
+            print(f"  {name} [{scale}]: {ratio:.2f}x")
+    else:
+        print("\nNo regressions against previous run")
+
+    return regressions
+
+def run_benchmarks(scales = None, repeat = 5, benchmark_dir = BENCHMARK_DIR):
+    scales = scales or list(SCALES)
+    path = results_path(benchmark_dir)
+    previous = load_previous(path)
+
+    run_info = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+    }
+
+    records = []
+
+    print(f"\n{'='*70}")
+    print("BENCHMARK STARTUP")
+    print(f"{'='*70}")
+    for module in STARTUP_MODULES:
+        timings = time_startup(module, repeat)
+        records.append({
+            'benchmark': f"import {module}",
+            'scale': 'startup',
+            'rows': 0,
+            'min_s': min(timings),
+            'median_s': float(np.median(timings)),
+        })
+        print(f"  {'import ' + module:<32} {'startup':<8} {'':>14}  min {min(timings) * 1000:9.2f} ms")
+
+    for scale in scales:
+        print(f"\n{'='*70}")
+        print(f"BENCHMARK SCALE {scale} ({SCALES[scale][0]} seasons x {SCALES[scale][1]} events)")
+        print(f"{'='*70}")
+        records.extend(run_scale(scale, repeat))
+
+    report_regressions(records, previous)
+
+    os.makedirs(benchmark_dir, exist_ok=True)
+    with open(path, 'a') as f:
+        for record in records:
+            f.write(json.dumps({**run_info, **record}) + "\n")
+    print(f"Results appended to: {path}")
+
+    return records
+
+if __name__ == "__main__":
+    run_benchmarks()
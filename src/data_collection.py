@@ -1,17 +1,41 @@
 import pandas as pd
-import fastf1 as f1
-import requests
 import os
-
-f1.Cache.enable_cache('fastf1cache')
+import tempfile
 
 base_url = "https://api.jolpi.ca/ergast/f1"
 
+REQUEST_TIMEOUT = 30
+
+# fastf1 and requests are slow to import, so they are only loaded once a collector needs them
+CACHE_DIR = os.environ.get('FASTF1_CACHE_DIR', 'fastf1cache')
+
+_fastf1 = None
+
+def set_cache_dir(cache_dir):
+    global CACHE_DIR
+    CACHE_DIR = cache_dir
+    if _fastf1 is not None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _fastf1.Cache.enable_cache(CACHE_DIR)
+
+def get_fastf1():
+    global _fastf1
+    if _fastf1 is None:
+        import fastf1
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fastf1.Cache.enable_cache(CACHE_DIR)
+        _fastf1 = fastf1
+    return _fastf1
+
+def get_json(url):
+    import requests
+    response = requests.get(url, timeout=REQUEST_TIMEOUT)
+    return response.json()
+
 def get_drivers(season):
     try:
         url = f"{base_url}/{season}/drivers.json"
-        response = requests.get(url)
-        data = response.json()
+        data = get_json(url)
         
         drivers = data.get('MRData', {}).get('DriverTable', {}).get('Drivers', [])
         
@@ -34,8 +58,7 @@ def get_drivers(season):
 def get_constructors(season):
     try:
         url = f"{base_url}/{season}/constructors.json"
-        response = requests.get(url)
-        data = response.json()
+        data = get_json(url)
         
         constructors = data.get('MRData', {}).get('ConstructorTable', {}).get('Constructors', [])
         
@@ -54,16 +77,24 @@ def get_constructors(season):
 
 def get_schedule_info(season):
     try:
-        df = f1.get_event_schedule(season)
+        df = get_fastf1().get_event_schedule(season)
         
-        df = df[['RoundNumber', 'EventName', 'Country', 'Location', 'EventDate', 'EventFormat']].copy()
+        # Session names and UTC start times let the live mode wait for each session
+        session_columns = {}
+        for i in range(1, 6):
+            session_columns[f'Session{i}'] = f'session{i}'
+            session_columns[f'Session{i}DateUtc'] = f'session{i}_date_utc'
+        
+        df = df[['RoundNumber', 'EventName', 'Country', 'Location', 'EventDate', 'EventFormat']
+                + [col for col in session_columns if col in df.columns]].copy()
         df.rename(columns={
             'RoundNumber': 'round',
             'EventName': 'event',
             'Country': 'country',
             'Location': 'location',
             'EventDate': 'date',
-            'EventFormat': 'format'
+            'EventFormat': 'format',
+            **session_columns
         }, inplace=True)
         
         df['season'] = season
@@ -76,7 +107,7 @@ def get_schedule_info(season):
 
 def get_session_results(season, event, session_type):
     try:
-        session = f1.get_session(season, event, session_type)
+        session = get_fastf1().get_session(season, event, session_type)
         session.load()
         df = session.results.copy()
         
@@ -113,8 +144,7 @@ def get_session_results(season, event, session_type):
 def get_driver_standings(season):
     try:
         url = f"{base_url}/{season}/driverstandings.json"
-        response = requests.get(url)
-        data = response.json()
+        data = get_json(url)
         
         standings_lists = data.get('MRData', {}).get('StandingsTable', {}).get('StandingsLists', [])
         standings = standings_lists[0].get('DriverStandings', []) if standings_lists else []
@@ -142,8 +172,7 @@ def get_driver_standings(season):
 def get_constructor_standings(season):
     try:
         url = f"{base_url}/{season}/constructorstandings.json"
-        response = requests.get(url)
-        data = response.json()
+        data = get_json(url)
         
         standings_lists = data.get('MRData', {}).get('StandingsTable', {}).get('StandingsLists', [])
         standings = standings_lists[0].get('ConstructorStandings', []) if standings_lists else []
@@ -167,7 +196,7 @@ def get_constructor_standings(season):
 
 def get_laptimes(season, event):
     try:
-        session = f1.get_session(season, event, 'R')
+        session = get_fastf1().get_session(season, event, 'R')
         session.load()
         df = session.laps.copy()
         
@@ -196,33 +225,38 @@ def get_laptimes(season, event):
         print(f"Skipping lap times {season} {event} {session}: {e}")
         return None
     
+def get_round_pitstops(season, rnd):
+    url = f"{base_url}/{season}/{rnd}/pitstops.json"
+    data = get_json(url)
+
+    races = data.get('MRData', {}).get('RaceTable', {}).get('Races', [])
+    
+    if not races:
+        return []
+    
+    race = races[0]
+    
+    stops = []
+    for stop in race.get('PitStops', []):
+        stops.append({
+            "season": season,
+            "race": race.get('raceName'),
+            "driver": stop.get("driverId"),
+            "stop": stop.get("stop"),
+            "lap_number": stop.get("lap"),
+            "duration": stop.get("duration"),
+        })
+    
+    return stops
+
 def get_pitstops(season):
     try:
-        race_count = f1.get_event_schedule(season).RoundNumber.max()
+        race_count = get_fastf1().get_event_schedule(season).RoundNumber.max()
         
         stops = []
         
         for rnd in range(1, race_count + 1):
-            url = f"{base_url}/{season}/{rnd}/pitstops.json"
-            response = requests.get(url)
-            data = response.json()
-
-            races = data.get('MRData', {}).get('RaceTable', {}).get('Races', [])
-            
-            if not races:
-                continue
-            
-            race = races[0]
-            
-            for stop in race.get('PitStops', []):
-                stops.append({
-                    "season": season,
-                    "race": race.get('raceName'),
-                    "driver": stop.get("driverId"),
-                    "stop": stop.get("stop"),
-                    "lap_number": stop.get("lap"),
-                    "duration": stop.get("duration"),
-                })
+            stops.extend(get_round_pitstops(season, rnd))
         
         return pd.DataFrame(stops)
     
@@ -232,7 +266,7 @@ def get_pitstops(season):
 
 def get_weather_data(season, event, session_type):
     try:
-        session = f1.get_session(season, event, session_type)
+        session = get_fastf1().get_session(season, event, session_type)
         session.load()
         
         df = session.weather_data.copy()
@@ -260,7 +294,7 @@ def get_weather_data(season, event, session_type):
     
 def get_race_events(season, event):
     try:
-        session = f1.get_session(season, event, 'R')
+        session = get_fastf1().get_session(season, event, 'R')
         session.load()
         
         df = session.race_control_messages.copy()
@@ -285,81 +319,173 @@ def get_race_events(season, event):
         print(f"Skipping race events {season} {event}: {e}")
         return None
 
-def collect_data(seasons, base_dir = "data/raw"):
+SEASON_DATASETS = [
+    ('drivers.csv', get_drivers),
+    ('constructors.csv', get_constructors),
+    ('schedule.csv', get_schedule_info),
+    ('driver_standings.csv', get_driver_standings),
+    ('constructor_standings.csv', get_constructor_standings),
+    ('pitstops.csv', get_pitstops),
+]
+
+# Event-level datasets merged from checkpoints into one season file each
+EVENT_DATASETS = {
+    'laptimes': 'laptimes.csv',
+    'race_events': 'race_events.csv',
+    'weather': 'weather.csv',
+    'quali_results': 'quali_results.csv',
+    'sprint_results': 'sprint_results.csv',
+    'race_results': 'race.csv',
+}
+
+RESULTS_DATASETS = {
+    'Q': 'quali_results',
+    'SQ': 'quali_results',
+    'SS': 'quali_results',
+    'S': 'sprint_results',
+    'R': 'race_results',
+}
+
+def get_session_types(event_format):
+    if event_format == 'sprint_shootout':
+        return ['SS', 'S', 'Q', 'R']
+    elif event_format == 'sprint_qualifying':
+        return ['SQ', 'S', 'Q', 'R']
+    else:
+        return ['Q', 'R']
+
+def replace_file(tmp_path, path):
+    # mkstemp creates 0600 files; keep the target's mode, or the umask default for a new file
+    if os.path.exists(path):
+        mode = os.stat(path).st_mode & 0o777
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+def write_csv_atomic(df, path):
+    # Write next to the target and rename, so a crash never leaves a half-written file behind
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', newline='') as f:
+            df.to_csv(f, index=False)
+        replace_file(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def checkpoint_path(checkpoint_dir, dataset, rnd, session_type):
+    return os.path.join(checkpoint_dir, f"{dataset}__{int(rnd):02d}_{session_type}.csv")
+
+def done_path(checkpoint_dir, rnd, session_type):
+    return os.path.join(checkpoint_dir, f"{int(rnd):02d}_{session_type}.done")
+
+def collect_session(season, event_name, session_type):
+    datasets = {}
+
+    df = get_session_results(season, event_name, session_type)
+    if df is None:
+        return None
+    datasets[RESULTS_DATASETS[session_type]] = df
+
+    datasets['weather'] = get_weather_data(season, event_name, session_type)
+
+    if session_type == 'R':
+        datasets['laptimes'] = get_laptimes(season, event_name)
+        datasets['race_events'] = get_race_events(season, event_name)
+
+    return datasets
+
+def has_data(df):
+    return df is not None and not df.empty
+
+def checkpoint_session(checkpoint_dir, rnd, session_type, datasets):
+    for dataset, df in datasets.items():
+        if has_data(df):
+            write_csv_atomic(df, checkpoint_path(checkpoint_dir, dataset, rnd, session_type))
+
+    missing = [dataset for dataset, df in datasets.items() if not has_data(df)]
+    if missing:
+        print(f"Incomplete round {int(rnd)} {session_type}, missing {missing}: will retry on resume")
+        return False
+
+    # The marker goes last: a unit only counts as complete once all its checkpoints exist
+    with open(done_path(checkpoint_dir, rnd, session_type), 'w'):
+        pass
+
+    return True
+
+def merge_checkpoints(season_dir):
+    checkpoint_dir = os.path.join(season_dir, "checkpoints")
+    if not os.path.isdir(checkpoint_dir):
+        print(f"No checkpoints found in {season_dir}")
+        return
+
+    checkpoints = sorted(os.listdir(checkpoint_dir))
+
+    for dataset, filename in EVENT_DATASETS.items():
+        parts = [name for name in checkpoints if name.startswith(f"{dataset}__") and name.endswith('.csv')]
+        if not parts:
+            print(f"Skipping {filename}: no checkpoints")
+            continue
+
+        # Stream one checkpoint at a time into a temp file, then swap it in
+        output_path = os.path.join(season_dir, filename)
+        fd, tmp_path = tempfile.mkstemp(dir=season_dir, suffix='.tmp')
+        try:
+            columns = None
+            with os.fdopen(fd, 'w', newline='') as f:
+                for name in parts:
+                    df = pd.read_csv(os.path.join(checkpoint_dir, name))
+                    if columns is None:
+                        columns = df.columns.tolist()
+                    df.reindex(columns=columns).to_csv(f, index=False, header=(name == parts[0]))
+            replace_file(tmp_path, output_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+def collect_data(seasons, base_dir = "data/raw", resume = False):
     for season in seasons:
         season_dir = os.path.join(base_dir, str(season))
-        os.makedirs(season_dir, exist_ok=True)
+        checkpoint_dir = os.path.join(season_dir, "checkpoints")
+        os.makedirs(checkpoint_dir, exist_ok=True)
         
         # SEASON-LEVEL DATA (Drivers, Constructors, Schedule, Standings, Pit Stops)
         
-        df = get_drivers(season)
-        df.to_csv(os.path.join(season_dir, "drivers.csv"), index=False)
-        
-        df = get_constructors(season)
-        df.to_csv(os.path.join(season_dir, "constructors.csv"), index=False)
-        
-        df = get_schedule_info(season)
-        df.to_csv(os.path.join(season_dir, "schedule.csv"), index=False)
-        
-        df = get_driver_standings(season)
-        df.to_csv(os.path.join(season_dir, "driver_standings.csv"), index=False)
-        
-        df = get_constructor_standings(season)
-        df.to_csv(os.path.join(season_dir, "constructor_standings.csv"), index=False)
-        
-        df = get_pitstops(season)
-        df.to_csv(os.path.join(season_dir, "pitstops.csv"), index=False)
+        # Always refetched, even on resume: standings and pit stops grow as the season goes on
+        for filename, get_func in SEASON_DATASETS:
+            path = os.path.join(season_dir, filename)
+            
+            df = get_func(season)
+            if has_data(df):
+                write_csv_atomic(df, path)
+            else:
+                print(f"No data for {filename} {season}: keeping the existing file, if any")
         
         # EVENT-LEVEL DATA (Results, Lap Times, Weather, Race Events)
         
-        schedule = f1.get_event_schedule(season)
-        
-        laptimes = []
-        race_events = []
-        weather_data = []
-        quali_results = []
-        sprint_results = []
-        race_results = []
+        schedule = get_fastf1().get_event_schedule(season)
         
         for _, event in schedule.iterrows():
+            rnd = event['RoundNumber']
             event_name = event['EventName']
-            event_format = event['EventFormat']
-            
-            df = get_laptimes(season, event_name)
-            laptimes.append(df)
             
-            df = get_race_events(season, event_name)
-            race_events.append(df)
-            
-            if event_format == 'sprint_shootout':
-                session_types = ['SS', 'S', 'Q', 'R']
-            elif event_format == 'sprint_qualifying':
-                session_types = ['SQ', 'S', 'Q', 'R']
-            elif event_format == 'conventional':
-                session_types = ['Q', 'R']
-            else:
-                session_types = ['Q', 'R']
+            for session_type in get_session_types(event['EventFormat']):
+                if resume and os.path.exists(done_path(checkpoint_dir, rnd, session_type)):
+                    continue
+                
+                datasets = collect_session(season, event_name, session_type)
+                if datasets is None:
+                    continue
                 
-            for session_type in session_types:
-                df = get_session_results(season, event_name, session_type)
-                if df is not None:
-                    if session_type in ['Q', 'SQ', 'SS']:
-                        quali_results.append(df)
-                    elif session_type == 'S':
-                        sprint_results.append(df)
-                    elif session_type == 'R':
-                        race_results.append(df)
-                        
-                df = get_weather_data(season, event_name, session_type)
-                weather_data.append(df)
+                checkpoint_session(checkpoint_dir, rnd, session_type, datasets)
                 
-        pd.concat(laptimes).to_csv(os.path.join(season_dir, "laptimes.csv"), index=False)
-        pd.concat(race_events).to_csv(os.path.join(season_dir, "race_events.csv"), index=False)
-        pd.concat(weather_data).to_csv(os.path.join(season_dir, "weather.csv"), index=False)
-        pd.concat(quali_results).to_csv(os.path.join(season_dir, "quali_results.csv"), index=False)
-        pd.concat(sprint_results).to_csv(os.path.join(season_dir, "sprint_results.csv"), index=False)
-        pd.concat(race_results).to_csv(os.path.join(season_dir, "race.csv"), index=False)
+        merge_checkpoints(season_dir)
         
 if __name__ == "__main__":
     seasons = [2025]
-    collect_data(seasons)
\ No newline at end of file
+    collect_data(seasons, resume=True)
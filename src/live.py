@@ -0,0 +1,242 @@
+import pandas as pd
+import asyncio
+import os
+
+from src import data_collection
+from src import preprocessing
+from src import analysis
+
+# FastF1 session names for the sessions that produce results
+SESSION_NAMES = {
+    'Qualifying': 'Q',
+    'Sprint Qualifying': 'SQ',
+    'Sprint Shootout': 'SS',
+    'Sprint': 'S',
+    'Race': 'R',
+}
+
+# Fallback for schedules without session columns: (days relative to race day, UTC hour)
+SESSION_TIMES = {
+    'conventional': [('Q', -1, 15), ('R', 0, 13)],
+    'sprint_qualifying': [('SQ', -2, 15), ('S', -1, 11), ('Q', -1, 15), ('R', 0, 13)],
+    'sprint_shootout': [('Q', -2, 15), ('SS', -1, 11), ('S', -1, 15), ('R', 0, 13)],
+}
+
+# Typical session length, after which results are worth polling for
+SESSION_DURATIONS = {
+    'Q': pd.Timedelta(hours=1),
+    'SQ': pd.Timedelta(minutes=45),
+    'SS': pd.Timedelta(minutes=45),
+    'S': pd.Timedelta(hours=1),
+    'R': pd.Timedelta(hours=2),
+}
+
+POLL_INTERVAL = pd.Timedelta(minutes=5)
+MAX_WAIT = pd.Timedelta(hours=6)
+
+class SystemClock:
+    def now(self):
+        return pd.Timestamp.now(tz='UTC')
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+class FakeClock:
+    # Jumps straight to the end of every sleep, so a whole weekend replays instantly
+    def __init__(self, start):
+        start = pd.Timestamp(start)
+        self.current = start.tz_localize('UTC') if start.tzinfo is None else start
+
+    def now(self):
+        return self.current
+
+    async def sleep(self, seconds):
+        self.current += pd.Timedelta(seconds=max(seconds, 0))
+        await asyncio.sleep(0)
+
+def get_round_pitstops(season, rnd):
+    try:
+        return pd.DataFrame(data_collection.get_round_pitstops(season, rnd))
+
+    except Exception as e:
+        print(f"Skipping pitstops {season} round {rnd}: {e}")
+        return None
+
+def collect_live_session(season, rnd, event, session_type):
+    datasets = data_collection.collect_session(season, event, session_type)
+
+    # Only the round that just finished; the rest of the season's stops are already on disk
+    if datasets is not None and session_type == 'R':
+        datasets['pitstops'] = get_round_pitstops(season, rnd)
+
+    return datasets
+
+async def fetch_session_data(season, rnd, event, session_type):
+    # FastF1 loading is blocking, so keep it off the event loop
+    return await asyncio.to_thread(collect_live_session, season, int(rnd), event, session_type)
+
+def season_dir(season):
+    return os.path.join(preprocessing.RAW_DIR, str(season))
+
+def load_schedule(season):
+    path = os.path.join(season_dir(season), "schedule.csv")
+
+    if not os.path.exists(path):
+        print(f"File not found: {path}")
+        return None
+
+    return preprocessing.clean_schedule_info(pd.read_csv(path))
+
+def to_utc(timestamp):
+    timestamp = pd.Timestamp(timestamp)
+    return timestamp.tz_localize('UTC') if timestamp.tzinfo is None else timestamp.tz_convert('UTC')
+
+def event_sessions(event):
+    # Prefer the schedule's own session start times; estimate from the race date only when they are missing
+    sessions = []
+    for i in range(1, 6):
+        name = event.get(f'session{i}')
+        start = event.get(f'session{i}_date_utc')
+        if name in SESSION_NAMES and pd.notna(start):
+            sessions.append((SESSION_NAMES[name], to_utc(start)))
+
+    if sessions or pd.isna(event['date']):
+        return sessions
+
+    race_day = to_utc(event['date']).normalize()
+    for session_type, days, hour in SESSION_TIMES.get(event['format'], SESSION_TIMES['conventional']):
+        sessions.append((session_type, race_day + pd.Timedelta(days=days, hours=hour)))
+
+    return sessions
+
+def build_session_plan(schedule):
+    rows = []
+    for _, event in schedule.iterrows():
+        for session_type, start in event_sessions(event):
+            rows.append({
+                'season': event['season'],
+                'round': event['round'],
+                'event': event['event'],
+                'session_type': session_type,
+                'ready_at': start + SESSION_DURATIONS[session_type],
+            })
+
+    if not rows:
+        return pd.DataFrame(columns=['season', 'round', 'event', 'session_type', 'ready_at'])
+
+    return pd.DataFrame(rows).sort_values('ready_at').reset_index(drop=True)
+
+def checkpoint_dir(season):
+    return os.path.join(season_dir(season), "checkpoints")
+
+def is_collected(season, rnd, session_type):
+    return os.path.exists(data_collection.done_path(checkpoint_dir(season), rnd, session_type))
+
+def results_ready(datasets, session_type):
+    if datasets is None:
+        return False
+
+    results = datasets.get(data_collection.RESULTS_DATASETS[session_type])
+    return data_collection.has_data(results) and results['finish_pos'].notna().any()
+
+def persist_session(season, rnd, session_type, datasets):
+    # Same checkpoint path as collect_data, so a later batch preprocess keeps what live mode added
+    datasets = dict(datasets)
+    pitstops = datasets.pop('pitstops', None)
+
+    os.makedirs(checkpoint_dir(season), exist_ok=True)
+    data_collection.checkpoint_session(checkpoint_dir(season), rnd, session_type, datasets)
+    data_collection.merge_checkpoints(season_dir(season))
+
+    names = [name for name, df in datasets.items() if data_collection.has_data(df)]
+    if data_collection.has_data(pitstops):
+        merge_round_pitstops(season, pitstops)
+        names.append('pitstops')
+
+    return preprocessing.preprocess_season_data(season, names)
+
+def merge_round_pitstops(season, pitstops):
+    path = os.path.join(season_dir(season), "pitstops.csv")
+
+    # Replace this race's stops and keep the rest of the season
+    if os.path.exists(path) and os.path.getsize(path) > 1:
+        existing = pd.read_csv(path, dtype={'duration': str})
+        existing = existing[~existing['race'].isin(pitstops['race'].unique())]
+        pitstops = pd.concat([existing, pitstops], ignore_index=True)
+
+    data_collection.write_csv_atomic(pitstops, path)
+
+def analysed_seasons():
+    if not os.path.isdir(analysis.PROCESSED_DIR):
+        return []
+
+    return sorted(
+        int(name) for name in os.listdir(analysis.PROCESSED_DIR)
+        if name.isdigit() and os.path.exists(os.path.join(analysis.PROCESSED_DIR, name, "pitstop_analysis.csv"))
+    )
+
+def refresh_features(session, tables):
+    # Race-derived features need the new laptimes and pit stops, so they only move after a race
+    if session['session_type'] != 'R':
+        return
+
+    season = session['season']
+    analysis.analyze_season_overtakes(season)
+    analysis.analyze_season_pitstops(season)
+    analysis.build_pitstop_baselines(analysed_seasons())
+
+async def wait_for_session(session, clock, fetch, poll_interval = POLL_INTERVAL, max_wait = MAX_WAIT):
+    delay = (session['ready_at'] - clock.now()).total_seconds()
+    if delay > 0:
+        print(f"Waiting {pd.Timedelta(seconds=delay)} for {session['event']} {session['session_type']}")
+        await clock.sleep(delay)
+
+    deadline = session['ready_at'] + max_wait
+    latest = None
+    while True:
+        datasets = await fetch(session['season'], session['round'], session['event'], session['session_type'])
+        if results_ready(datasets, session['session_type']):
+            latest = datasets
+            if all(data_collection.has_data(df) for df in datasets.values()):
+                return datasets
+
+        if clock.now() + poll_interval > deadline:
+            if latest is None:
+                print(f"Giving up on {session['event']} {session['session_type']}: no results after {max_wait}")
+            else:
+                print(f"Keeping partial data for {session['event']} {session['session_type']} after {max_wait}")
+            return latest
+
+        await clock.sleep(poll_interval.total_seconds())
+
+async def run_weekend(season, clock = None, fetch = None, on_update = None, poll_interval = POLL_INTERVAL, max_wait = MAX_WAIT):
+    clock = clock or SystemClock()
+    fetch = fetch or fetch_session_data
+    on_update = on_update or refresh_features
+
+    schedule = load_schedule(season)
+    if schedule is None or schedule.empty:
+        print(f"No schedule for {season}")
+        return
+
+    plan = build_session_plan(schedule)
+    plan = plan[plan['ready_at'] + max_wait > clock.now()]
+
+    for _, session in plan.iterrows():
+        if is_collected(season, session['round'], session['session_type']):
+            continue
+
+        datasets = await wait_for_session(session, clock, fetch, poll_interval, max_wait)
+        if datasets is None:
+            continue
+
+        tables = persist_session(season, session['round'], session['session_type'], datasets)
+
+        # Defaults to refreshing the score features; prediction refreshes can hook in here instead
+        on_update(session, tables)
+
+def run_live(season, on_update = None):
+    asyncio.run(run_weekend(season, on_update=on_update))
+
+if __name__ == "__main__":
+    run_live(2025)
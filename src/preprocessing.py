@@ -21,7 +21,7 @@ DRIVER_CORRECTIONS = {
     'TSU': ['TSU', 'TSUNODA', 'YUKI TSUNODA'],
     'RIC': ['RIC', 'RICCIARDO', 'DANIEL RICCIARDO'],
     'HUL': ['HUL', 'HULKENBERG', 'NICO HULKENBERG'],
-    'MAG': ['MAG', 'MAGNUSSEN', 'KEVIN MAGNUSSEN'],
+    'MAG': ['MAG', 'MAGNUSSEN', 'KEVIN MAGNUSSEN', 'KEVIN_MAGNUSSEN'],
     'ALB': ['ALB', 'ALBON', 'ALEXANDER ALBON'],
     'SAR': ['SAR', 'SARGEANT', 'LOGAN SARGEANT'],
     'BOT': ['BOT', 'BOTTAS', 'VALTTERI BOTTAS'],
@@ -35,7 +35,7 @@ DRIVER_CORRECTIONS = {
     'BOR': ['BOR', 'BORTOLETO', 'GABRIEL BORTOLETO'],
     'VET': ['VET', 'VETTEL', 'SEBASTIAN VETTEL'],
     'LAT': ['LAT', 'LATIFI', 'NICHOLAS LATIFI'],
-    'MSC': ['MSC', 'SCHUMACHER', 'MICK SCHUMACHER'],
+    'MSC': ['MSC', 'SCHUMACHER', 'MICK SCHUMACHER', 'MICK_SCHUMACHER'],
     'DEV': ['DEV', 'DE VRIES', 'NYCK DE VRIES', 'DE_VRIES'],
 }
 
@@ -186,6 +186,12 @@ def clean_schedule_info(df):
     df['location'] = df['location'].str.strip()
     df['format'] = df['format'].str.strip()
     
+    for i in range(1, 6):
+        if f'session{i}' in df.columns:
+            df[f'session{i}'] = df[f'session{i}'].str.strip()
+        if f'session{i}_date_utc' in df.columns:
+            df[f'session{i}_date_utc'] = pd.to_datetime(df[f'session{i}_date_utc'], errors='coerce', utc=True)
+    
     if 'season' in df.columns:
         df = df.sort_values(['season', 'round']).reset_index(drop=True)
     
@@ -357,7 +363,7 @@ def validate_dataframe(df, name):
     
     return True
 
-def preprocess_season_data(season):
+def preprocess_season_data(season, names = None):
     print(f"\n{'='*70}")
     print(f"PREPROCESSING SEASON {season}")
     print(f"{'='*70}")
@@ -383,6 +389,10 @@ def preprocess_season_data(season):
     ]
     
     for name, filename, clean_func, kwargs in datasets:
+        # Incremental updates only rebuild the tables whose raw files changed
+        if names is not None and name not in names:
+            continue
+        
         print(f"\n{'─'*70}")
         print(f"Processing: {name}")
         print(f"{'─'*70}")
@@ -409,6 +419,8 @@ def preprocess_season_data(season):
     print(f"PREPROCESSING COMPLETED FOR SEASON {season}")
     print(f"{'='*70}")
     
+    return results
+    
 if __name__ == "__main__":
     seasons = [2025]
     for season in seasons:
@@ -0,0 +1,300 @@
+import pandas as pd
+import numpy as np
+import os
+
+# Kept apart from data/raw so generated files never overwrite or mix with collected ones
+SYNTHETIC_DIR = "data/synthetic"
+
+# (code, car number, Ergast driverId, first name, last name, FastF1 team name)
+GRID = [
+    ('VER', 1, 'max_verstappen', 'Max', 'Verstappen', 'Red Bull Racing'),
+    ('TSU', 22, 'tsunoda', 'Yuki', 'Tsunoda', 'Red Bull Racing'),
+    ('NOR', 4, 'norris', 'Lando', 'Norris', 'McLaren'),
+    ('PIA', 81, 'piastri', 'Oscar', 'Piastri', 'McLaren'),
+    ('LEC', 16, 'leclerc', 'Charles', 'Leclerc', 'Ferrari'),
+    ('HAM', 44, 'hamilton', 'Lewis', 'Hamilton', 'Ferrari'),
+    ('RUS', 63, 'russell', 'George', 'Russell', 'Mercedes'),
+    ('ANT', 12, 'antonelli', 'Andrea Kimi', 'Antonelli', 'Mercedes'),
+    ('ALO', 14, 'alonso', 'Fernando', 'Alonso', 'Aston Martin'),
+    ('STR', 18, 'stroll', 'Lance', 'Stroll', 'Aston Martin'),
+    ('GAS', 10, 'gasly', 'Pierre', 'Gasly', 'Alpine'),
+    ('COL', 43, 'colapinto', 'Franco', 'Colapinto', 'Alpine'),
+    ('ALB', 23, 'albon', 'Alexander', 'Albon', 'Williams'),
+    ('SAI', 55, 'sainz', 'Carlos', 'Sainz', 'Williams'),
+    ('HAD', 6, 'hadjar', 'Isack', 'Hadjar', 'Racing Bulls'),
+    ('LAW', 30, 'lawson', 'Liam', 'Lawson', 'Racing Bulls'),
+    ('OCO', 31, 'ocon', 'Esteban', 'Ocon', 'Haas F1 Team'),
+    ('BEA', 87, 'bearman', 'Oliver', 'Bearman', 'Haas F1 Team'),
+    ('HUL', 27, 'hulkenberg', 'Nico', 'Hulkenberg', 'Kick Sauber'),
+    ('BOR', 5, 'bortoleto', 'Gabriel', 'Bortoleto', 'Kick Sauber'),
+]
+
+COMPOUNDS = ['SOFT', 'MEDIUM', 'HARD']
+
+def format_timedelta(seconds):
+    return pd.to_timedelta(seconds, unit='s').astype(str)
+
+def generate_schedule(season, n_events, rng):
+    formats = np.where(rng.random(n_events) < 0.25, 'sprint_qualifying', 'conventional')
+    start = pd.Timestamp(f"{season}-03-01")
+    dates = [start + pd.Timedelta(weeks=2 * i) for i in range(n_events)]
+
+    df = pd.DataFrame({
+        'round': np.arange(1, n_events + 1),
+        'event': [f"Synthetic {rnd} Grand Prix" for rnd in range(1, n_events + 1)],
+        'country': [f"Country {rnd}" for rnd in range(1, n_events + 1)],
+        'location': [f"Circuit {rnd}" for rnd in range(1, n_events + 1)],
+        'date': dates,
+        'format': formats,
+        'season': season,
+    })
+
+    # (session name, days before race day, UTC hour) in FastF1's Session1..5 order
+    sessions = {
+        'conventional': [('Practice 1', -2, 11), ('Practice 2', -2, 15), ('Practice 3', -1, 11), ('Qualifying', -1, 15), ('Race', 0, 13)],
+        'sprint_qualifying': [('Practice 1', -2, 11), ('Sprint Qualifying', -2, 15), ('Sprint', -1, 11), ('Qualifying', -1, 15), ('Race', 0, 13)],
+    }
+    for i in range(5):
+        names = [sessions[fmt][i][0] for fmt in formats]
+        offsets = [pd.Timedelta(days=sessions[fmt][i][1], hours=sessions[fmt][i][2]) for fmt in formats]
+        df[f'session{i + 1}'] = names
+        df[f'session{i + 1}_date_utc'] = [date + offset for date, offset in zip(dates, offsets)]
+
+    return df
+
+def generate_drivers(season):
+    return pd.DataFrame({
+        'first_name': [d[3] for d in GRID],
+        'last_name': [d[4] for d in GRID],
+        'driver': [d[0] for d in GRID],
+        'car_number': [d[1] for d in GRID],
+        'nationality': 'Synthetic',
+    })
+
+def generate_constructors(season):
+    teams = list(dict.fromkeys(d[5] for d in GRID))
+    return pd.DataFrame({'constructor': teams, 'nationality': 'Synthetic'})
+
+def generate_standings(season, race_results):
+    points = race_results.groupby(['driver', 'car_number', 'constructor'], as_index=False)['points'].sum()
+    wins = race_results[race_results['finish_pos'] == 1].groupby('driver').size()
+    points['wins'] = points['driver'].map(wins).fillna(0).astype(int)
+    points = points.sort_values('points', ascending=False).reset_index(drop=True)
+    points['position'] = np.arange(1, len(points) + 1)
+    points['season'] = season
+    driver_standings = points[['season', 'driver', 'car_number', 'constructor', 'position', 'points', 'wins']]
+
+    teams = points.groupby('constructor', as_index=False)[['points', 'wins']].sum()
+    teams = teams.sort_values('points', ascending=False).reset_index(drop=True)
+    teams['position'] = np.arange(1, len(teams) + 1)
+    teams['season'] = season
+    constructor_standings = teams[['season', 'constructor', 'position', 'points', 'wins']]
+
+    return driver_standings, constructor_standings
+
+def generate_race(season, event, rng, n_laps, session_type = 'R'):
+    n_drivers = len(GRID)
+    codes = np.array([d[0] for d in GRID])
+    numbers = np.array([d[1] for d in GRID])
+    teams = np.array([d[5] for d in GRID])
+
+    grid = rng.permutation(n_drivers) + 1
+    pace = 90 + rng.normal(0, 0.6, n_drivers) + grid * 0.05
+
+    # Cars that retire stop recording laps partway through
+    retire_lap = np.where(rng.random(n_drivers) < 0.1, rng.integers(1, n_laps, n_drivers), n_laps)
+
+    n_stops = rng.integers(1, 3, n_drivers) if session_type == 'R' else np.zeros(n_drivers, dtype=int)
+    stop_laps = [np.sort(rng.choice(np.arange(5, n_laps - 2), size=k, replace=False)) + 1 for k in n_stops]
+
+    lap_times = pace[:, None] + rng.normal(0, 0.4, (n_drivers, n_laps))
+    for i, laps in enumerate(stop_laps):
+        lap_times[i, laps - 1] += rng.normal(21, 1.5, len(laps))
+    lap_times[:, 0] += grid * 0.3 + 5
+
+    cumulative = np.cumsum(lap_times, axis=1)
+    lap_numbers = np.arange(1, n_laps + 1)
+    running = lap_numbers[None, :] <= retire_lap[:, None]
+    cumulative = np.where(running, cumulative, np.nan)
+
+    # Running cars rank by elapsed time; retired cars fall to the back
+    order = np.where(np.isnan(cumulative), np.inf, cumulative)
+    positions = order.argsort(axis=0).argsort(axis=0) + 1
+
+    stints = np.ones((n_drivers, n_laps), dtype=int)
+    for i, laps in enumerate(stop_laps):
+        for lap in laps:
+            stints[i, lap:] += 1
+    compounds = rng.integers(0, len(COMPOUNDS), (n_drivers, 3))
+
+    mask = running.ravel()
+    driver_idx = np.repeat(np.arange(n_drivers), n_laps)[mask]
+    stint_flat = stints.ravel()[mask]
+    sectors = lap_times.ravel()[mask, None] * np.array([0.31, 0.37, 0.32])
+
+    laptimes = pd.DataFrame({
+        'driver': codes[driver_idx],
+        'car_number': numbers[driver_idx],
+        'constructor': teams[driver_idx],
+        'lap_number': np.tile(lap_numbers, n_drivers)[mask],
+        'lap_time': format_timedelta(lap_times.ravel()[mask]),
+        'position': positions.ravel()[mask],
+        'sector1': format_timedelta(sectors[:, 0]),
+        'sector2': format_timedelta(sectors[:, 1]),
+        'sector3': format_timedelta(sectors[:, 2]),
+        'stint': stint_flat,
+        'tyre_compound': np.array(COMPOUNDS)[compounds[driver_idx, stint_flat - 1]],
+        'season': season,
+        'event': event,
+        'session_type': session_type,
+    })
+
+    finish = positions[:, -1]
+    status = np.where(retire_lap < n_laps, 'Retired', 'Finished')
+    results = pd.DataFrame({
+        'car_number': numbers,
+        'driver': codes,
+        'constructor': teams,
+        'finish_pos': finish.astype(float),
+        'grid_pos': grid.astype(float),
+        'status': status,
+        'season': season,
+        'event': event,
+        'session_type': session_type,
+    })
+
+    pitstops = pd.DataFrame({
+        'season': season,
+        'race': event,
+        'driver': np.repeat([d[2] for d in GRID], n_stops),
+        'stop': np.concatenate([np.arange(1, k + 1) for k in n_stops]) if n_stops.sum() else [],
+        'lap_number': np.concatenate(stop_laps) if n_stops.sum() else [],
+        'duration': np.round(rng.normal(22, 1.5, n_stops.sum()), 3).astype(str),
+    })
+
+    return laptimes, results, pitstops
+
+def generate_quali(season, event, rng, session_type = 'Q'):
+    n_drivers = len(GRID)
+    base = 88 + rng.normal(0, 0.5, n_drivers)
+    order = base.argsort()
+    finish = np.empty(n_drivers, dtype=int)
+    finish[order] = np.arange(1, n_drivers + 1)
+
+    q1 = format_timedelta(base + 0.8)
+    q2 = pd.Series(format_timedelta(base + 0.4)).where(finish <= 15)
+    q3 = pd.Series(format_timedelta(base)).where(finish <= 10)
+
+    return pd.DataFrame({
+        'car_number': [d[1] for d in GRID],
+        'driver': [d[0] for d in GRID],
+        'constructor': [d[5] for d in GRID],
+        'Q1': q1,
+        'Q2': q2,
+        'Q3': q3,
+        'finish_pos': finish.astype(float),
+        'season': season,
+        'event': event,
+        'session_type': session_type,
+    })
+
+def generate_weather(season, event, rng, session_type, n_samples = 120):
+    return pd.DataFrame({
+        'time': format_timedelta(np.arange(n_samples) * 60.0),
+        'air_temp_c': np.round(25 + rng.normal(0, 3) + rng.normal(0, 0.3, n_samples).cumsum() * 0.1, 1),
+        'track_temp_c': np.round(38 + rng.normal(0, 5) + rng.normal(0, 0.5, n_samples).cumsum() * 0.1, 1),
+        'humidity_pct': np.round(rng.uniform(30, 80) + rng.normal(0, 1, n_samples), 1),
+        'pressure_mbar': np.round(1010 + rng.normal(0, 0.5, n_samples), 1),
+        'rainfall': rng.random(n_samples) < 0.05,
+        'wind_speed_kph': np.round(np.abs(rng.normal(2, 1, n_samples)), 1),
+        'wind_dir_deg': rng.integers(0, 360, n_samples),
+        'season': season,
+        'event': event,
+        'session_type': session_type,
+    })
+
+def generate_race_events(season, event, rng, n_laps, n_messages = 40):
+    laps = np.sort(rng.integers(1, n_laps + 1, n_messages))
+    flags = rng.choice(['GREEN', 'YELLOW', 'DOUBLE YELLOW', 'CLEAR', 'BLUE'], n_messages)
+
+    return pd.DataFrame({
+        'time': format_timedelta(laps * 91.0),
+        'category': rng.choice(['Flag', 'Other', 'CarEvent'], n_messages),
+        'message': [f"{flag} FLAG IN SECTOR {rng.integers(1, 4)}" for flag in flags],
+        'flag': flags,
+        'scope': rng.choice(['Track', 'Sector', 'Driver'], n_messages),
+        'lap_number': laps,
+        'season': season,
+        'event': event,
+        'session_type': 'R',
+    })
+
+def generate_season(season, n_events, base_dir = SYNTHETIC_DIR, n_laps = 57, seed = 0):
+    rng = np.random.default_rng([seed, season])
+    season_dir = os.path.join(base_dir, str(season))
+    os.makedirs(season_dir, exist_ok=True)
+
+    schedule = generate_schedule(season, n_events, rng)
+
+    laptimes = []
+    race_events = []
+    weather_data = []
+    quali_results = []
+    sprint_results = []
+    race_results = []
+    pitstops = []
+
+    for _, event in schedule.iterrows():
+        event_name = event['event']
+
+        if event['format'] == 'sprint_qualifying':
+            session_types = ['SQ', 'S', 'Q', 'R']
+        else:
+            session_types = ['Q', 'R']
+
+        for session_type in session_types:
+            if session_type == 'R':
+                laps, results, stops = generate_race(season, event_name, rng, n_laps)
+                laptimes.append(laps)
+                race_results.append(results)
+                pitstops.append(stops)
+                race_events.append(generate_race_events(season, event_name, rng, n_laps))
+            elif session_type == 'S':
+                _, results, _ = generate_race(season, event_name, rng, n_laps // 3, 'S')
+                sprint_results.append(results)
+            else:
+                quali_results.append(generate_quali(season, event_name, rng, session_type))
+
+            weather_data.append(generate_weather(season, event_name, rng, session_type))
+
+    race = pd.concat(race_results, ignore_index=True)
+    points = {1: 25, 2: 18, 3: 15, 4: 12, 5: 10, 6: 8, 7: 6, 8: 4, 9: 2, 10: 1}
+    race['points'] = race['finish_pos'].map(points).fillna(0)
+    driver_standings, constructor_standings = generate_standings(season, race)
+
+    files = {
+        'drivers.csv': generate_drivers(season),
+        'constructors.csv': generate_constructors(season),
+        'schedule.csv': schedule,
+        'driver_standings.csv': driver_standings,
+        'constructor_standings.csv': constructor_standings,
+        'pitstops.csv': pd.concat(pitstops, ignore_index=True),
+        'laptimes.csv': pd.concat(laptimes, ignore_index=True),
+        'race_events.csv': pd.concat(race_events, ignore_index=True),
+        'weather.csv': pd.concat(weather_data, ignore_index=True),
+        'quali_results.csv': pd.concat(quali_results, ignore_index=True),
+        'race.csv': race.drop(columns=['points']),
+    }
+    if sprint_results:
+        files['sprint_results.csv'] = pd.concat(sprint_results, ignore_index=True)
+
+    for filename, df in files.items():
+        df.to_csv(os.path.join(season_dir, filename), index=False)
+
+    return season_dir
+
+def generate_seasons(seasons, n_events, base_dir = SYNTHETIC_DIR, n_laps = 57, seed = 0):
+    return [generate_season(season, n_events, base_dir, n_laps, seed) for season in seasons]
+
+if __name__ == "__main__":
+    generate_seasons([2025], 24)
@@ -0,0 +1,5 @@
+import sys
+import os
+
+# Tests import the pipeline as the src package, the same way main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
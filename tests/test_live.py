@@ -0,0 +1,202 @@
+import pandas as pd
+import asyncio
+
+import pytest
+
+from src import data_collection
+from src import preprocessing
+from src import analysis
+from src import live
+
+SEASON = 2025
+EVENT = 'Synthetic 1 Grand Prix'
+
+@pytest.fixture
+def data_dirs(tmp_path, monkeypatch):
+    raw_dir = tmp_path / 'raw'
+    processed_dir = tmp_path / 'processed'
+    monkeypatch.setattr(preprocessing, 'RAW_DIR', str(raw_dir))
+    monkeypatch.setattr(preprocessing, 'PROCESSED_DIR', str(processed_dir))
+
+    season_dir = raw_dir / str(SEASON)
+    season_dir.mkdir(parents=True)
+    pd.DataFrame({
+        'round': [1],
+        'event': [EVENT],
+        'country': ['Country 1'],
+        'location': ['Circuit 1'],
+        'date': ['2025-03-16'],
+        'format': ['conventional'],
+        'session1': ['Practice 1'],
+        'session1_date_utc': ['2025-03-14 11:00:00'],
+        'session4': ['Qualifying'],
+        'session4_date_utc': ['2025-03-15 15:00:00'],
+        'session5': ['Race'],
+        'session5_date_utc': ['2025-03-16 13:00:00'],
+        'season': [SEASON],
+    }).to_csv(season_dir / 'schedule.csv', index=False)
+
+    return raw_dir, processed_dir
+
+def session_datasets(session_type):
+    results = pd.DataFrame({
+        'car_number': [1, 4],
+        'driver': ['VER', 'NOR'],
+        'constructor': ['Red Bull Racing', 'McLaren'],
+        'finish_pos': [1.0, 2.0],
+        'season': SEASON,
+        'event': EVENT,
+        'session_type': session_type,
+    })
+    if session_type in ['R', 'S']:
+        results['grid_pos'] = [2.0, 1.0]
+        results['status'] = 'Finished'
+    else:
+        for q_col in ['Q1', 'Q2', 'Q3']:
+            results[q_col] = ['0 days 00:01:30', '0 days 00:01:31']
+    weather = pd.DataFrame({
+        'time': ['0 days 00:00:00'],
+        'air_temp_c': [25.0],
+        'season': SEASON,
+        'event': EVENT,
+        'session_type': session_type,
+    })
+    return {data_collection.RESULTS_DATASETS[session_type]: results, 'weather': weather}
+
+class StubSource:
+    # Returns nothing for the first `empty_polls` calls of each session, then that session's data
+    def __init__(self, clock, empty_polls):
+        self.clock = clock
+        self.empty_polls = empty_polls
+        self.calls = []
+
+    async def fetch(self, season, rnd, event, session_type):
+        self.calls.append((self.clock.now(), session_type))
+        polls = sum(1 for _, called in self.calls if called == session_type)
+        if polls <= self.empty_polls.get(session_type, 0):
+            return None
+        return session_datasets(session_type)
+
+def record_updates(updates):
+    return lambda session, tables: updates.append((session['session_type'], tables))
+
+def run(clock, source, on_update, max_wait = pd.Timedelta(hours=1)):
+    asyncio.run(live.run_weekend(
+        SEASON,
+        clock=clock,
+        fetch=source.fetch,
+        on_update=on_update,
+        poll_interval=pd.Timedelta(minutes=10),
+        max_wait=max_wait,
+    ))
+
+def test_plan_uses_schedule_session_times(data_dirs):
+    plan = live.build_session_plan(live.load_schedule(SEASON))
+
+    assert plan['session_type'].tolist() == ['Q', 'R']
+    assert plan['ready_at'].tolist() == [
+        pd.Timestamp('2025-03-15 16:00', tz='UTC'),
+        pd.Timestamp('2025-03-16 15:00', tz='UTC'),
+    ]
+
+def test_plan_falls_back_to_race_date_without_session_columns():
+    schedule = pd.DataFrame({
+        'round': [1],
+        'event': [EVENT],
+        'date': [pd.Timestamp('2025-03-16')],
+        'format': ['conventional'],
+        'season': [SEASON],
+    })
+    plan = live.build_session_plan(schedule)
+
+    assert plan['session_type'].tolist() == ['Q', 'R']
+    assert plan['ready_at'].iloc[1] == pd.Timestamp('2025-03-16 15:00', tz='UTC')
+
+def test_results_on_second_poll_and_give_up_after_max_wait(data_dirs):
+    raw_dir, processed_dir = data_dirs
+    clock = live.FakeClock('2025-03-14')
+    source = StubSource(clock, {'Q': 1, 'R': 100})
+    updates = []
+
+    run(clock, source, record_updates(updates))
+
+    quali_polls = [when for when, session_type in source.calls if session_type == 'Q']
+    assert quali_polls == [pd.Timestamp('2025-03-15 16:00', tz='UTC'), pd.Timestamp('2025-03-15 16:10', tz='UTC')]
+
+    # The race never reports results: the last poll lands on ready_at + max_wait
+    race_polls = [when for when, session_type in source.calls if session_type == 'R']
+    assert race_polls[0] == pd.Timestamp('2025-03-16 15:00', tz='UTC')
+    assert race_polls[-1] == pd.Timestamp('2025-03-16 16:00', tz='UTC')
+    assert len(race_polls) == 7
+
+    assert [session_type for session_type, _ in updates] == ['Q']
+    assert len(updates[0][1]['quali_results']) == 2
+
+    checkpoint_dir = raw_dir / str(SEASON) / 'checkpoints'
+    assert (checkpoint_dir / '01_Q.done').exists()
+    assert not (checkpoint_dir / '01_R.done').exists()
+    assert (raw_dir / str(SEASON) / 'quali_results.csv').exists()
+    assert len(pd.read_csv(processed_dir / str(SEASON) / 'quali_results.csv')) == 2
+
+def test_rerun_skips_collected_sessions(data_dirs):
+    clock = live.FakeClock('2025-03-14')
+    run(clock, StubSource(clock, {}), record_updates([]))
+
+    clock = live.FakeClock('2025-03-14')
+    source = StubSource(clock, {})
+    updates = []
+    run(clock, source, record_updates(updates))
+
+    assert source.calls == []
+    assert updates == []
+
+def pitstop_rows(race, drivers):
+    return pd.DataFrame({
+        'season': SEASON,
+        'race': race,
+        'driver': drivers,
+        'stop': 1,
+        'lap_number': 20,
+        'duration': '22.5',
+    })
+
+def test_round_pitstops_replace_only_that_race(data_dirs):
+    raw_dir, _ = data_dirs
+    path = raw_dir / str(SEASON) / 'pitstops.csv'
+    pd.concat([pitstop_rows('Earlier Grand Prix', ['max_verstappen']), pitstop_rows(EVENT, ['stale'])]).to_csv(path, index=False)
+
+    live.merge_round_pitstops(SEASON, pitstop_rows(EVENT, ['max_verstappen', 'norris']))
+
+    merged = pd.read_csv(path)
+    assert merged[merged['race'] == 'Earlier Grand Prix']['driver'].tolist() == ['max_verstappen']
+    assert merged[merged['race'] == EVENT]['driver'].tolist() == ['max_verstappen', 'norris']
+
+def test_race_waits_for_its_own_pitstops(data_dirs):
+    clock = live.FakeClock('2025-03-14')
+    source = StubSource(clock, {})
+    updates = []
+
+    async def fetch(season, rnd, event, session_type):
+        datasets = await source.fetch(season, rnd, event, session_type)
+        if session_type == 'R':
+            # Ergast has nothing for this round yet, so the race stays incomplete
+            datasets['pitstops'] = pd.DataFrame()
+        return datasets
+
+    asyncio.run(live.run_weekend(SEASON, clock=clock, fetch=fetch, on_update=record_updates(updates), poll_interval=pd.Timedelta(minutes=10), max_wait=pd.Timedelta(hours=1)))
+
+    race_polls = [when for when, session_type in source.calls if session_type == 'R']
+    assert len(race_polls) == 7
+    assert [session_type for session_type, _ in updates] == ['Q', 'R']
+
+def test_default_update_refreshes_scores_after_race(data_dirs, monkeypatch):
+    calls = []
+    monkeypatch.setattr(analysis, 'analyze_season_overtakes', lambda season: calls.append(('overtakes', season)))
+    monkeypatch.setattr(analysis, 'analyze_season_pitstops', lambda season: calls.append(('pitstops', season)))
+    monkeypatch.setattr(analysis, 'build_pitstop_baselines', lambda seasons: calls.append(('baselines', seasons)))
+
+    clock = live.FakeClock('2025-03-14')
+    run(clock, StubSource(clock, {}), None)
+
+    assert calls[:2] == [('overtakes', SEASON), ('pitstops', SEASON)]
+    assert [name for name, _ in calls] == ['overtakes', 'pitstops', 'baselines']